@@ -20,6 +20,7 @@ import signal
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -45,9 +46,16 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'  # No Color
 
+# Emit ANSI escapes only on a real terminal and when NO_COLOR is unset,
+# so piped/captured output stays grep-friendly
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
 def print_color(color: str, message: str):
-    """Print colored output."""
-    print(f"{color}{message}{Colors.NC}")
+    """Print colored output (plain text when color is disabled)."""
+    if _USE_COLOR:
+        sys.stdout.write(color + message + Colors.NC + "\n")
+    else:
+        print(message)
 
 def ensure_directories():
     """Create necessary directories."""
@@ -62,20 +70,50 @@ def get_log_file(category: str) -> Path:
     """Get log file path for a category."""
     return LOG_DIR / f"{category}_agent.log"
 
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process is alive without signaling it."""
+    if sys.platform.startswith('linux'):
+        # Cheaper than kill(): a single stat on procfs
+        return os.path.exists(f"/proc/{pid}")
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+def _snapshot_pids() -> Dict[str, int]:
+    """Read every PID file in one pass, pruning stale ones.
+
+    Returns a mapping of category -> live PID for all running agents.
+    """
+    pids = {}
+    for category in ALL_CATEGORIES:
+        pid_file = get_pid_file(category)
+        try:
+            pid = int(pid_file.read_text().strip())
+        except (OSError, ValueError):
+            continue
+        if _pid_alive(pid):
+            pids[category] = pid
+        else:
+            # PID file exists but process is dead
+            pid_file.unlink(missing_ok=True)
+    return pids
+
 def is_agent_running(category: str) -> bool:
     """Check if agent is running."""
     pid_file = get_pid_file(category)
-    
+
     if pid_file.exists():
         try:
             pid = int(pid_file.read_text().strip())
-            # Check if process is still running
-            os.kill(pid, 0)
-            return True
         except (OSError, ValueError):
-            # PID file exists but process is dead
             pid_file.unlink(missing_ok=True)
             return False
+        if _pid_alive(pid):
+            return True
+        # PID file exists but process is dead
+        pid_file.unlink(missing_ok=True)
     return False
 
 def start_agent(category: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> bool:
@@ -140,21 +178,20 @@ def stop_agent(category: str) -> bool:
         # Send SIGTERM first
         os.kill(pid, signal.SIGTERM)
         
-        # Wait up to 5 seconds for graceful shutdown
-        for i in range(5):
-            try:
-                os.kill(pid, 0)  # Check if still running
-                time.sleep(1)
-            except OSError:
-                break
-        
+        # Wait up to 5 seconds for graceful shutdown, polling at 50 ms so a
+        # fast exit is noticed almost immediately. os.waitpid is no use
+        # here: the agent is normally not a child of the stopping process.
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline and _pid_alive(pid):
+            time.sleep(0.05)
+
         # Force kill if still running
-        try:
-            os.kill(pid, 0)
+        if _pid_alive(pid):
             print_color(Colors.YELLOW, f"Force killing {category} agent...")
-            os.kill(pid, signal.SIGKILL)
-        except OSError:
-            pass
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
         
         pid_file.unlink(missing_ok=True)
         print_color(Colors.GREEN, f"✅ {category} agent stopped")
@@ -174,26 +211,29 @@ def show_status(category: str):
         print_color(Colors.RED, f"❌ {category} agent: STOPPED")
 
 def start_all(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
-    """Start all agents."""
+    """Start all agents in parallel."""
     print_color(Colors.BLUE, f"🚀 Starting all OpenConvert agents on {host}:{port}...")
-    success_count = 0
-    
-    for category in ALL_CATEGORIES:
-        if start_agent(category, host, port):
-            success_count += 1
-    
+
+    # Each start_agent sleeps 2s to verify the child survived; running them
+    # in threads overlaps those waits so start-all takes ~2s, not 7 x 2s
+    with ThreadPoolExecutor(max_workers=len(ALL_CATEGORIES)) as executor:
+        results = list(executor.map(
+            lambda category: start_agent(category, host, port), ALL_CATEGORIES
+        ))
+    success_count = sum(results)
+
     print_color(Colors.GREEN, f"✅ Started {success_count}/{len(ALL_CATEGORIES)} agents")
     return success_count
 
 def stop_all() -> int:
-    """Stop all agents."""
+    """Stop all agents in parallel."""
     print_color(Colors.BLUE, "🛑 Stopping all OpenConvert agents...")
-    success_count = 0
-    
-    for category in ALL_CATEGORIES:
-        if stop_agent(category):
-            success_count += 1
-    
+
+    # Overlap the per-agent graceful-shutdown windows
+    with ThreadPoolExecutor(max_workers=len(ALL_CATEGORIES)) as executor:
+        results = list(executor.map(stop_agent, ALL_CATEGORIES))
+    success_count = sum(results)
+
     print_color(Colors.GREEN, f"✅ Stopped {success_count} agents")
     return success_count
 
@@ -204,9 +244,15 @@ def show_all_status():
     print(f"PID Directory: {PID_DIR}")
     print(f"Log Directory: {LOG_DIR}")
     print()
-    
+
+    # One batched PID scan instead of per-category file reads and probes
+    pids = _snapshot_pids()
     for category in ALL_CATEGORIES:
-        show_status(category)
+        pid = pids.get(category)
+        if pid is not None:
+            print_color(Colors.GREEN, f"✅ {category} agent: RUNNING (PID: {pid})")
+        else:
+            print_color(Colors.RED, f"❌ {category} agent: STOPPED")
 
 def restart_agents(category: Optional[str] = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
     """Restart agents."""
@@ -221,6 +267,44 @@ def restart_agents(category: Optional[str] = None, host: str = DEFAULT_HOST, por
         time.sleep(2)
         start_all(host, port)
 
+def _tail_file(log_file: Path, history: int = 10):
+    """Follow a log file in-process (a tail -F equivalent).
+
+    Seeks to the last 64 KiB to print the final `history` lines — like
+    tail, startup cost is independent of file size — then polls for new
+    output. Survives rotation and truncation by reopening when the inode
+    changes or the file shrinks below our read position. Avoids forking
+    a tail subprocess and works on platforms without tail.
+    """
+    f = log_file.open('rb')
+    try:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - 64 * 1024))
+        if f.tell() > 0:
+            f.readline()  # discard the partial line the seek landed in
+        for line in f.read().splitlines(keepends=True)[-history:]:
+            sys.stdout.write(line.decode(errors='replace'))
+        sys.stdout.flush()
+        while True:
+            line = f.readline()
+            if line:
+                sys.stdout.write(line.decode(errors='replace'))
+                sys.stdout.flush()
+                continue
+            try:
+                st = log_file.stat()
+            except FileNotFoundError:
+                time.sleep(0.2)
+                continue
+            if st.st_ino != os.fstat(f.fileno()).st_ino or st.st_size < f.tell():
+                # Rotated or truncated: reopen and continue from the top
+                f.close()
+                f = log_file.open('rb')
+            else:
+                time.sleep(0.2)
+    finally:
+        f.close()
+
 def show_logs(category: Optional[str] = None):
     """Show logs for category or list all log files."""
     if category:
@@ -228,8 +312,7 @@ def show_logs(category: Optional[str] = None):
         if log_file.exists():
             print_color(Colors.BLUE, f"📄 Showing logs for {category} agent:")
             try:
-                # Use tail -f equivalent
-                subprocess.run(['tail', '-f', str(log_file)])
+                _tail_file(log_file)
             except KeyboardInterrupt:
                 pass
         else:
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+PyPI Upload Helper for OpenConvert
+
+Automates the package preparation, build, check and upload workflow
+described in PYPI_UPLOAD.md.
+
+Usage:
+    python scripts/pypi_upload.py prepare      # Validate package structure
+    python scripts/pypi_upload.py clean        # Remove build artifacts
+    python scripts/pypi_upload.py build        # Build sdist + wheel
+    python scripts/pypi_upload.py check        # Validate distributions
+    python scripts/pypi_upload.py test-upload  # Upload to TestPyPI
+    python scripts/pypi_upload.py upload       # Upload to production PyPI
+    python scripts/pypi_upload.py all          # prepare + build + check
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Resolved once; commands run with cwd= instead of mutating the
+# process-global working directory via os.chdir, which is unsafe once
+# steps run on threads.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DIST_DIR = PROJECT_ROOT / "dist"
+
+
+@lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """Memoized shutil.which; each uncached lookup stats every PATH entry."""
+    return shutil.which(tool)
+
+
+def run_command(cmd: List[str], description: str,
+                cwd: Path = PROJECT_ROOT) -> bool:
+    """Run a command, streaming its output as it is produced.
+
+    Output is echoed line by line rather than buffered with
+    capture_output, so the user sees progress immediately, peak memory
+    stays bounded (only a short tail is retained for the failure
+    summary), and chatty tools cannot deadlock on a full pipe.
+
+    Args:
+        cmd: Command and arguments to execute
+        description: Human-readable description for status messages
+        cwd: Working directory for the command (default: project root)
+
+    Returns:
+        bool: True if the command succeeded
+    """
+    print(f"🔄 {description}...")
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=str(cwd),
+    )
+    tail = deque(maxlen=200)
+    assert proc.stdout is not None  # PIPE above guarantees a stream
+    for line in proc.stdout:
+        sys.stdout.write(line)
+        tail.append(line)
+    returncode = proc.wait()
+    if returncode != 0:
+        print(f"❌ {description} failed (exit code {returncode})")
+        if tail:
+            sys.stderr.write("Last output:\n")
+            sys.stderr.writelines(tail)
+        return False
+    print(f"✅ {description} completed")
+    return True
+
+
+def check_requirements() -> bool:
+    """Check that build and upload tools are available."""
+    print("🔍 Checking requirements...")
+    missing = []
+    for tool in ("python3", "twine"):
+        if _which(tool) is None:
+            missing.append(tool)
+    # build is a module, not a console script
+    result = subprocess.run(
+        [sys.executable, "-c", "import build"], capture_output=True
+    )
+    if result.returncode != 0:
+        missing.append("build")
+    if missing:
+        print(f"❌ Missing required tools: {', '.join(missing)}")
+        print("Install them with: pip install build twine")
+        return False
+    print("✅ All requirements satisfied")
+    return True
+
+
+def _collect_artifacts(project_root: Path) -> Tuple[List[Path], List[Path]]:
+    """Find build artifacts in one tree walk.
+
+    A single os.scandir traversal replaces per-pattern rglob calls,
+    which each re-walk the whole tree.
+
+    Args:
+        project_root: Repository root to scan
+
+    Returns:
+        Tuple of (directories to remove, files to remove)
+    """
+    dirs_to_remove: List[Path] = []
+    files_to_remove: List[Path] = []
+    top_level_dirs = {"build", "dist"}
+
+    def _scan(directory: str, depth: int) -> None:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name == ".git":
+                    continue
+                if name == "__pycache__" or name.endswith(".egg-info") or (
+                    depth == 0 and name in top_level_dirs
+                ):
+                    dirs_to_remove.append(Path(entry.path))
+                    continue  # removed wholesale; no need to descend
+                _scan(entry.path, depth + 1)
+            elif entry.is_file(follow_symlinks=False):
+                if name.endswith((".pyc", ".pyo")):
+                    files_to_remove.append(Path(entry.path))
+
+    _scan(str(project_root), 0)
+    return dirs_to_remove, files_to_remove
+
+
+def clean_build_artifacts() -> bool:
+    """Remove build artifacts (build/, dist/, egg-info, pycache, pyc)."""
+    print("🧹 Cleaning build artifacts...")
+    dirs_to_remove, files_to_remove = _collect_artifacts(PROJECT_ROOT)
+
+    if not dirs_to_remove and not files_to_remove:
+        print("✅ Nothing to clean")
+        return True
+
+    # Removal is syscall-bound; overlap unlinks/rmtrees across threads
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(
+            lambda d: shutil.rmtree(d, ignore_errors=True), dirs_to_remove
+        ))
+        list(executor.map(
+            lambda f: f.unlink(missing_ok=True), files_to_remove
+        ))
+
+    print(
+        f"✅ Removed {len(dirs_to_remove)} directories and "
+        f"{len(files_to_remove)} files"
+    )
+    return True
+
+
+def prepare_package() -> bool:
+    """Validate package structure before building."""
+    print("📋 Preparing package...")
+    required_files = [
+        "setup.py",
+        "pyproject.toml",
+        "README.md",
+        "LICENSE",
+        "src/openconvert/__init__.py",
+        "src/openconvert/openconvert_cli.py",
+    ]
+    # One scandir per directory instead of one stat per required file
+    present = set()
+    for directory in (PROJECT_ROOT, PROJECT_ROOT / "src" / "openconvert"):
+        try:
+            with os.scandir(directory) as entries:
+                prefix = directory.relative_to(PROJECT_ROOT)
+                for entry in entries:
+                    present.add(str(prefix / entry.name))
+        except OSError:
+            pass
+    missing = [f for f in required_files if f not in present]
+    if missing:
+        print(f"❌ Missing required files: {', '.join(missing)}")
+        return False
+
+    print("✅ Package structure looks good")
+    return True
+
+
+def build_package(clean: bool = True) -> bool:
+    """Build source distribution and wheel.
+
+    Args:
+        clean: Remove stale artifacts first (the `all` pipeline passes
+               False because it has already cleaned concurrently)
+    """
+    if clean and not clean_build_artifacts():
+        return False
+
+    # Build in-process when possible: each `python -m ...` child pays
+    # fork/exec plus interpreter startup that a direct call avoids.
+    try:
+        from build import ProjectBuilder
+    except ImportError:
+        return run_command(
+            [sys.executable, "-m", "build"], "Building distributions"
+        )
+
+    print("🔄 Building distributions...")
+    try:
+        builder = ProjectBuilder(str(PROJECT_ROOT))
+        builder.build("sdist", str(DIST_DIR))
+        builder.build("wheel", str(DIST_DIR))
+    except Exception as e:
+        print(f"❌ Building distributions failed: {e}")
+        return False
+    print("✅ Building distributions completed")
+    return True
+
+
+def check_package() -> bool:
+    """Validate the built distributions with twine."""
+    dist_files = sorted(str(p) for p in DIST_DIR.glob("*"))
+    if not dist_files:
+        print("❌ No distribution files found. Run 'build' first.")
+        return False
+
+    # Check in-process to skip another interpreter cold start
+    try:
+        from twine.commands.check import check as twine_check
+    except ImportError:
+        return run_command(
+            [sys.executable, "-m", "twine", "check"] + dist_files,
+            "Checking distributions",
+        )
+
+    print("🔄 Checking distributions...")
+    try:
+        failed = twine_check(dist_files)
+    except Exception as e:
+        print(f"❌ Checking distributions failed: {e}")
+        return False
+    if failed:
+        print("❌ Checking distributions failed")
+        return False
+    print("✅ Checking distributions completed")
+    return True
+
+
+def _parallel_upload(dist_files: List[str], repository: str,
+                     parallel: int, description: str) -> bool:
+    """Upload dist files concurrently, one twine call per file.
+
+    Upload time per file is dominated by TLS handshakes and HTTP
+    latency, so independent files overlap well. A single Settings
+    object is shared so credentials are resolved once.
+
+    Args:
+        dist_files: Paths of the distributions to upload
+        repository: Repository name from .pypirc (e.g. "testpypi")
+        parallel: Number of concurrent uploads
+        description: Human-readable description for status messages
+
+    Returns:
+        bool: True if every file uploaded successfully
+    """
+    try:
+        from twine.commands.upload import upload as twine_upload
+        from twine.settings import Settings
+    except ImportError:
+        print("⚠️  twine not importable; falling back to serial upload")
+        return run_command(
+            [sys.executable, "-m", "twine", "upload",
+             "--repository", repository] + dist_files,
+            description,
+        )
+
+    print(f"🔄 {description} ({parallel} workers)...")
+    settings = Settings(repository_name=repository)
+
+    def _upload_one(path: str) -> bool:
+        try:
+            twine_upload(settings, [path])
+            return True
+        except Exception as e:
+            print(f"❌ Upload failed for {path}: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        results = list(executor.map(_upload_one, dist_files))
+
+    if not all(results):
+        print(f"❌ {description} failed")
+        return False
+    print(f"✅ {description} completed")
+    return True
+
+
+def upload_to_testpypi(parallel: int = 1) -> bool:
+    """Upload distributions to TestPyPI."""
+    dist_files = sorted(str(p) for p in DIST_DIR.glob("*"))
+    if not dist_files:
+        print("❌ No distribution files found. Run 'build' first.")
+        return False
+    if parallel > 1 and len(dist_files) > 1:
+        return _parallel_upload(
+            dist_files, "testpypi", parallel, "Uploading to TestPyPI"
+        )
+    return run_command(
+        [sys.executable, "-m", "twine", "upload", "--repository", "testpypi"]
+        + dist_files,
+        "Uploading to TestPyPI",
+    )
+
+
+def upload_to_pypi() -> bool:
+    """Upload distributions to production PyPI."""
+    dist_files = sorted(str(p) for p in DIST_DIR.glob("*"))
+    if not dist_files:
+        print("❌ No distribution files found. Run 'build' first.")
+        return False
+
+    print("⚠️  Uploading to PRODUCTION PyPI. This cannot be undone.")
+    answer = input("Continue? [y/N] ").strip().lower()
+    if answer != "y":
+        print("Aborted.")
+        return False
+    return run_command(
+        [sys.executable, "-m", "twine", "upload"] + dist_files,
+        "Uploading to PyPI",
+    )
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="PyPI upload helper for openconvert"
+    )
+    parser.add_argument(
+        "command",
+        choices=[
+            "prepare", "clean", "build", "check",
+            "test-upload", "upload", "all",
+        ],
+        help="Step to run",
+    )
+    parser.add_argument(
+        "--parallel", type=int, default=1, metavar="N",
+        help="Concurrent uploads for test-upload (default: 1, serial)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "prepare":
+        success = prepare_package()
+    elif args.command == "clean":
+        success = clean_build_artifacts()
+    elif args.command == "build":
+        success = build_package()
+    elif args.command == "check":
+        success = check_package()
+    elif args.command == "test-upload":
+        success = upload_to_testpypi(parallel=args.parallel)
+    elif args.command == "upload":
+        success = upload_to_pypi()
+    else:  # all
+        # Requirements probing and the artifact clean are independent
+        # (read-only PATH/import checks vs dist/build removal), so they
+        # run concurrently; prepare and build still depend on the clean.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            requirements_ok = executor.submit(check_requirements)
+            clean_ok = executor.submit(clean_build_artifacts)
+            success = requirements_ok.result() and clean_ok.result()
+        if success:
+            success = prepare_package()
+        if success:
+            success = build_package(clean=False)
+        if success:
+            success = check_package()
+        if success:
+            print("🎉 Package ready. Next: "
+                  "python scripts/pypi_upload.py test-upload")
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
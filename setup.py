@@ -2,26 +2,30 @@
 """Setup script for openconvert CLI tool."""
 
 from setuptools import setup, find_packages
-import os
+from functools import lru_cache
+from pathlib import Path
 import re
 
-# Read the README file for long description
+_HERE = Path(__file__).parent
+_VERSION_RE = re.compile(r"^__version__ = ['\"]([^'\"]*)['\"]", re.M)
+
+# Read the README file for long description (cached: setuptools imports
+# setup.py several times per build — metadata, sdist, wheel)
+@lru_cache(maxsize=1)
 def read_readme():
-    readme_path = os.path.join(os.path.dirname(__file__), "README.md")
-    if os.path.exists(readme_path):
-        with open(readme_path, "r", encoding="utf-8") as f:
-            return f.read()
+    readme_path = _HERE / "README.md"
+    if readme_path.exists():
+        return readme_path.read_text(encoding="utf-8")
     return "OpenConvert CLI tool for connecting to OpenAgents file conversion network"
 
 # Get version from __init__.py
+@lru_cache(maxsize=1)
 def get_version():
-    init_path = os.path.join(os.path.dirname(__file__), "src", "openconvert", "__init__.py")
-    with open(init_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", content, re.M)
-        if version_match:
-            return version_match.group(1)
-        raise RuntimeError("Unable to find version string.")
+    init_path = _HERE / "src" / "openconvert" / "__init__.py"
+    version_match = _VERSION_RE.search(init_path.read_text(encoding="utf-8"))
+    if version_match:
+        return version_match.group(1)
+    raise RuntimeError("Unable to find version string.")
 
 setup(
     name="openconvert",
@@ -62,6 +66,13 @@ setup(
         "service": [
             "agconvert",  # Optional for running conversion services
         ],
+        "speedups": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "zstandard>=0.18.0",  # Optional payload compression
+        ],
+        "magic": [
+            "python-magic>=0.4.27",  # Optional content-based MIME detection
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -5,19 +5,100 @@ A command-line interface for connecting to the OpenConvert OpenAgents network
 to discover file conversion services and perform file conversions.
 """
 
-import asyncio
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
 
 __version__ = "1.1.1"
 __author__ = "OpenAgents Team"
 __email__ = "team@openagents.com"
 
-# Import the async convert function
-try:
-    from openconvert.openconvert_cli import convert as _async_convert
-except ImportError:
-    from openconvert_cli import convert as _async_convert
+# The CLI module (and its transitive openagents imports) is loaded
+# lazily on first conversion, so `import openconvert` for __version__
+# or metadata stays cheap.
+_cli_convert = None
+
+
+def _resolve_async_convert():
+    """Import and cache the CLI's async convert on first use."""
+    global _cli_convert
+    if _cli_convert is None:
+        try:
+            from openconvert.openconvert_cli import convert as _cli_convert
+        except ImportError:
+            from openconvert_cli import convert as _cli_convert
+    return _cli_convert
+
+
+def __getattr__(name):
+    # PEP 562: keep the historical module attribute resolvable without
+    # paying its import cost at package-import time
+    if name == "_async_convert":
+        return _resolve_async_convert()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Shared background event loop for the sync API. asyncio.run would
+# create and tear down a loop (and the cached network connection with
+# it) on every call; one long-lived loop amortizes that across calls.
+_loop: Optional["asyncio.AbstractEventLoop"] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> "asyncio.AbstractEventLoop":
+    """Return the shared background event loop, starting it on first use."""
+    import asyncio
+
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            # Use uvloop for the loop when available (speedups extra);
+            # it is faster for socket-heavy batch conversions
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever,
+                name="openconvert-loop",
+                daemon=True,
+            )
+            thread.start()
+    return _loop
+
+
+async def aconvert(
+    input_files: List[Path],
+    output_path: Path,
+    host: str = "network.openconvert.ai",
+    port: int = 8765,
+) -> bool:
+    """
+    Convert files using the OpenConvert network (async API).
+
+    Preferred entry point for async callers: runs on the caller's event
+    loop with no thread bridge.
+
+    Args:
+        input_files: List of input file paths to convert
+        output_path: Output file path
+        host: OpenConvert network host (default: network.openconvert.ai)
+        port: OpenConvert network port (default: 8765)
+
+    Returns:
+        bool: True if conversion successful, False otherwise
+    """
+    return await _resolve_async_convert()(
+        input_files=input_files,
+        output_path=output_path,
+        host=host,
+        port=port
+    )
 
 
 def convert(
@@ -38,19 +119,89 @@ def convert(
     Returns:
         bool: True if conversion successful, False otherwise
     """
+    import asyncio
+
     try:
-        result = asyncio.run(_async_convert(
-            input_files=input_files,
-            output_path=output_path,
-            host=host,
-            port=port
-        ))
-        return result
+        future = asyncio.run_coroutine_threadsafe(
+            aconvert(
+                input_files=input_files,
+                output_path=output_path,
+                host=host,
+                port=port
+            ),
+            _get_loop()
+        )
+        return future.result()
     except Exception as e:
         print(f"Conversion failed: {e}")
         return False
 
 
+async def _aconvert_files(
+    pairs: List[Tuple[Path, Path]],
+    host: str,
+    port: int,
+    concurrency: int,
+) -> List[bool]:
+    """Run a batch of conversions over one shared client connection."""
+    from openconvert.client import get_client, _detect_mime, _EXT2MIME
+
+    client = await get_client(host=host, port=port)
+    files = []
+    for input_file, output_file in pairs:
+        input_path = Path(input_file)
+        output_path = Path(output_file)
+        files.append({
+            'input_file': input_path,
+            'output_file': output_path,
+            'source_format': _detect_mime(input_path),
+            'target_format': _EXT2MIME.get(
+                output_path.suffix.lower(), 'application/octet-stream'
+            ),
+        })
+    return await client.convert_files_batch(files, max_concurrency=concurrency)
+
+
+def convert_files(
+    pairs: List[Tuple[Path, Path]],
+    host: str = "network.openconvert.ai",
+    port: int = 8765,
+    concurrency: int = 8,
+) -> List[bool]:
+    """
+    Convert many files over a single network connection.
+
+    Opens the client and discovers agents once, then issues the
+    conversions concurrently, so an N-file batch costs one handshake
+    plus N overlapped transfers instead of N sequential round trips.
+
+    Args:
+        pairs: List of (input_file, output_file) path pairs; formats are
+               auto-detected from each file
+        host: OpenConvert network host (default: network.openconvert.ai)
+        port: OpenConvert network port (default: 8765)
+        concurrency: Maximum conversions in flight at once (default: 8)
+
+    Returns:
+        List[bool]: Per-pair success flags, in input order
+
+    Example:
+        >>> from openconvert import convert_files
+        >>> results = convert_files([("a.txt", "a.pdf"), ("b.txt", "b.pdf")])
+    """
+    import asyncio
+
+    try:
+        future = asyncio.run_coroutine_threadsafe(
+            _aconvert_files(pairs, host, port, concurrency),
+            _get_loop()
+        )
+        return future.result()
+    except Exception as e:
+        print(f"Batch conversion failed: {e}")
+        return [False] * len(pairs)
+
+
 def convert_file(
     input_path: str, 
     output_path: str,
@@ -92,8 +243,10 @@ def convert_file(
 
 # Export main functions
 __all__ = [
+    "aconvert",
     "convert",
     "convert_file",
+    "convert_files",
     "__version__",
     "__author__",
     "__email__",
@@ -9,10 +9,14 @@ discovering conversion agents, and performing file conversions.
 import asyncio
 import logging
 import base64
+import binascii
+import mimetypes
+import mmap
 import tempfile
+import time
 import uuid
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 # Import OpenAgents modules
 import sys
@@ -30,13 +34,110 @@ from openagents.models.messages import DirectMessage, BaseMessage
 
 logger = logging.getLogger(__name__)
 
+# Build the extension -> MIME map once so per-file detection is a single
+# dict lookup instead of a walk of the mimetypes database
+mimetypes.init()
+_EXT2MIME: Dict[str, str] = dict(mimetypes.types_map)
+
+# Optional libmagic content sniffing for files with missing/wrong extensions
+try:
+    import magic
+    _MAGIC = magic.Magic(mime=True)
+except ImportError:
+    _MAGIC = None
+
+# Optional zstd payload compression (level 3: fast, 3-5x on text formats)
+try:
+    import zstandard as zstd
+    _ZSTD_CCTX = zstd.ZstdCompressor(level=3)
+    _ZSTD_DCTX = zstd.ZstdDecompressor()
+except ImportError:
+    _ZSTD_CCTX = None
+    _ZSTD_DCTX = None
+
+
+def _detect_mime(path: Path) -> str:
+    """Detect a file's MIME type.
+
+    Uses the cheap extension lookup first; when the extension is unknown,
+    falls back to sniffing the first 8 KB of content with libmagic (if the
+    optional python-magic dependency is installed).
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        str: Detected MIME type, or 'application/octet-stream'
+    """
+    mime = _EXT2MIME.get(path.suffix.lower())
+    if mime:
+        return mime
+    if _MAGIC is not None:
+        try:
+            with path.open('rb') as f:
+                return _MAGIC.from_buffer(f.read(8192))
+        except Exception as e:
+            logger.debug(f"Content sniffing failed for {path}: {e}")
+    return 'application/octet-stream'
+
+# Encode chunk size: a multiple of 3 so each chunk base64-encodes without
+# padding and the pieces concatenate into a valid stream
+_ENCODE_CHUNK = 3 * (1 << 21)  # 6 MiB
+
+
+def _encode_file_b64(path: Path) -> str:
+    """Base64-encode a file without holding the raw bytes fully in memory.
+
+    Large files are mmapped and encoded from zero-copy memoryview slices,
+    so the raw bytes stay in the page cache instead of being copied into
+    Python objects; small files use a plain chunked read. Either way, peak
+    transient memory is one chunk of raw bytes plus the encoded output,
+    rather than the whole file twice.
+
+    Args:
+        path: Path to the file to encode
+
+    Returns:
+        str: Base64-encoded file contents
+    """
+    pieces = []
+    with path.open('rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _ENCODE_CHUNK:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, _ENCODE_CHUNK):
+                        pieces.append(binascii.b2a_base64(
+                            view[offset:offset + _ENCODE_CHUNK], newline=False
+                        ))
+                finally:
+                    view.release()
+        else:
+            while True:
+                chunk = f.read(_ENCODE_CHUNK)
+                if not chunk:
+                    break
+                pieces.append(binascii.b2a_base64(chunk, newline=False))
+    return b''.join(pieces).decode('ascii')
+
 
 class OpenConvertClient:
     """Client for interacting with the OpenConvert OpenAgents network."""
     
+    #: How long (seconds) a discover_agents result stays fresh
+    DISCOVER_TTL = 30.0
+
+    #: Short settle delay (seconds) after connect for protocol registration
+    REGISTRATION_GRACE = 0.1
+
+    #: Window (seconds) after connect during which an empty discovery
+    #: result is retried once, in case registration had not landed yet
+    REGISTRATION_WINDOW = 2.0
+
     def __init__(self, agent_id: Optional[str] = None):
         """Initialize the OpenConvert client.
-        
+
         Args:
             agent_id: Optional agent ID. If not provided, a random one will be generated.
         """
@@ -44,7 +145,13 @@ class OpenConvertClient:
         self.client = AgentClient(self.agent_id)
         self.discovery_adapter = OpenConvertDiscoveryAdapter()
         self.messaging_adapter = SimpleMessagingAgentAdapter()
-        self.conversion_responses = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._agent_pending: Dict[str, List[str]] = {}
+        self._discover_cache: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._ensured_dirs: set = set()
+        self._connected_at = 0.0
+        # Loop that owns this client's transport and futures; set on connect
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.connected = False
         
         logger.info(f"Initialized OpenConvert client with ID: {self.agent_id}")
@@ -86,11 +193,15 @@ class OpenConvertClient:
             self.messaging_adapter.register_message_handler("conversion_response", self._handle_conversion_response)
             
             self.connected = True
+            self._loop = asyncio.get_running_loop()
+            self._connected_at = time.monotonic()
             logger.info("✅ Successfully connected to OpenConvert network")
-            
-            # Give some time for protocol registration
-            await asyncio.sleep(1)
-            
+
+            # The adapters expose no registration-ack callback, so yield
+            # briefly for protocol registration instead of a fixed 1s sleep;
+            # discover_agents retries once if registration is still settling
+            await asyncio.sleep(self.REGISTRATION_GRACE)
+
             return True
             
         except Exception as e:
@@ -105,8 +216,22 @@ class OpenConvertClient:
             sender_id: ID of the agent that sent the response
         """
         if content and (content.get("conversion_status") or content.get("action") == "conversion_result"):
-            self.conversion_responses[sender_id] = content
             logger.debug(f"Received conversion response from {sender_id}")
+
+            # Resolve the future the requesting coroutine is awaiting.
+            # Agents echo back the request_id we sent; fall back to the
+            # oldest outstanding request for this sender if they don't.
+            request_id = content.get("request_id")
+            if request_id is None:
+                pending_ids = self._agent_pending.get(sender_id)
+                if pending_ids:
+                    request_id = pending_ids[0]
+
+            future = self._pending.pop(request_id, None) if request_id else None
+            if future is not None and not future.done():
+                future.set_result(content)
+            else:
+                logger.debug(f"Dropping unmatched conversion response from {sender_id}")
     
     async def discover_agents(self, source_format: str, target_format: str) -> List[Dict[str, Any]]:
         """Discover agents capable of performing a specific conversion.
@@ -120,19 +245,33 @@ class OpenConvertClient:
         """
         if not self.connected:
             raise RuntimeError("Client is not connected to network")
-        
+
+        # Serve repeat lookups for the same format pair from the TTL cache
+        now = time.monotonic()
+        cached = self._discover_cache.get((source_format, target_format))
+        if cached is not None and now - cached[0] < self.DISCOVER_TTL:
+            logger.debug(f"Using cached agents for {source_format} -> {target_format}")
+            return cached[1]
+
         logger.info(f"🔍 Discovering agents for {source_format} -> {target_format}")
-        
+
         try:
             # Use the discovery adapter to find suitable agents
             agents = await self.discovery_adapter.discover_conversion_agents(source_format, target_format)
-            
+
+            # Right after connect, protocol registration may still be in
+            # flight; retry an empty result once before trusting it
+            if not agents and time.monotonic() - self._connected_at < self.REGISTRATION_WINDOW:
+                await asyncio.sleep(0.25)
+                agents = await self.discovery_adapter.discover_conversion_agents(source_format, target_format)
+
             logger.info(f"📋 Found {len(agents)} capable agents:")
             for agent in agents:
                 agent_id = agent.get('agent_id', 'Unknown')
                 description = agent.get('description', 'No description')
                 logger.info(f"  - {agent_id}: {description}")
-            
+
+            self._discover_cache[(source_format, target_format)] = (now, agents)
             return agents
             
         except Exception as e:
@@ -146,10 +285,12 @@ class OpenConvertClient:
         source_format: str,
         target_format: str,
         prompt: Optional[str] = None,
-        timeout: int = 60
+        timeout: int = 60,
+        compress: bool = False,
+        agent_id: Optional[str] = None
     ) -> bool:
         """Convert a single file using the OpenConvert network.
-        
+
         Args:
             input_file: Path to input file
             output_file: Path to output file
@@ -157,7 +298,12 @@ class OpenConvertClient:
             target_format: Target MIME type
             prompt: Optional conversion instructions
             timeout: Timeout in seconds for conversion
-            
+            compress: Compress the payload with zstd before sending. Opt-in
+                      because the target agent must understand the
+                      'zstd+b64' encoding; requires the zstandard package.
+            agent_id: Agent to use, skipping discovery. When None, the
+                      first agent found for the format pair is used.
+
         Returns:
             bool: True if conversion successful
         """
@@ -166,90 +312,134 @@ class OpenConvertClient:
         
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
-        
-        logger.info(f"🔄 Converting {input_file.name}: {source_format} -> {target_format}")
+
+        # PurePath.name rebuilds its string per access; bind it once
+        filename = input_file.name
+
+        logger.info(f"🔄 Converting {filename}: {source_format} -> {target_format}")
         
         try:
-            # Discover agents capable of this conversion
-            agents = await self.discover_agents(source_format, target_format)
-            
-            if not agents:
-                logger.error(f"❌ No agents found for {source_format} -> {target_format} conversion")
-                return False
-            
-            # Use the first available agent
-            target_agent = agents[0]
-            agent_id = target_agent['agent_id']
-            
+            # Discover agents capable of this conversion unless the caller
+            # already knows which agent to use
+            if agent_id is None:
+                agents = await self.discover_agents(source_format, target_format)
+
+                if not agents:
+                    logger.error(f"❌ No agents found for {source_format} -> {target_format} conversion")
+                    return False
+
+                # Use the first available agent
+                agent_id = agents[0]['agent_id']
+
             logger.info(f"🎯 Using agent: {agent_id}")
             
-            # Read and encode the input file
-            file_data = input_file.read_bytes()
-            file_data_b64 = base64.b64encode(file_data).decode('ascii')
+            # Read and encode the input file in chunks to bound peak memory.
+            # Run it in the default executor so a large or slow disk read
+            # does not stall other conversions sharing the event loop.
+            loop = asyncio.get_running_loop()
+            encoding = "base64"
+            if compress and _ZSTD_CCTX is not None:
+                def _encode_compressed() -> str:
+                    payload = _ZSTD_CCTX.compress(input_file.read_bytes())
+                    return binascii.b2a_base64(payload, newline=False).decode('ascii')
+
+                file_data_b64 = await loop.run_in_executor(None, _encode_compressed)
+                encoding = "zstd+b64"
+            else:
+                if compress:
+                    logger.warning("zstandard not installed; sending payload uncompressed")
+                file_data_b64 = await loop.run_in_executor(None, _encode_file_b64, input_file)
             
-            # Prepare conversion request
+            # Prepare conversion request. The request_id lets concurrent
+            # requests to the same agent resolve to the right caller.
+            request_id = uuid.uuid4().hex
             request_content = {
+                "request_id": request_id,
                 "file_data": file_data_b64,
-                "filename": input_file.name,
+                "filename": filename,
                 "source_format": source_format,
-                "target_format": target_format
+                "target_format": target_format,
+                "encoding": encoding,
+                # Advertise that raw bytes are accepted in the response, so
+                # agents on binary-capable transports can skip base64
+                "accept_raw_bytes": True
             }
-            
+
             # Add prompt if provided
             if prompt:
                 request_content["prompt"] = prompt
                 logger.info(f"💬 Using prompt: {prompt}")
-            
-            # Clear any previous responses
-            if agent_id in self.conversion_responses:
-                del self.conversion_responses[agent_id]
-            
-            # Send conversion request
-            logger.info(f"📤 Sending conversion request to {agent_id}")
-            await self.messaging_adapter.send_direct_message(agent_id, request_content)
-            
-            # Wait for response with timeout
-            for _ in range(timeout):
-                await asyncio.sleep(1)
-                
-                if agent_id in self.conversion_responses:
-                    response = self.conversion_responses[agent_id]
-                    
-                    # Check if conversion was successful
-                    if response.get("conversion_status") == "success" or response.get("success") == True:
-                        # Extract converted file data
-                        converted_data = response.get("file_data") or response.get("output_data")
-                        
-                        if not converted_data:
-                            logger.error("❌ No converted data in response")
-                            return False
-                        
-                        # Decode and save converted file
-                        try:
-                            converted_bytes = base64.b64decode(converted_data)
-                            
-                            # Ensure output directory exists
-                            output_file.parent.mkdir(parents=True, exist_ok=True)
-                            
-                            # Write converted file
-                            output_file.write_bytes(converted_bytes)
-                            
-                            logger.info(f"✅ Conversion successful: {output_file}")
-                            return True
-                            
-                        except Exception as e:
-                            logger.error(f"❌ Error saving converted file: {e}")
+
+            # Register a future the response handler will resolve
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+            self._agent_pending.setdefault(agent_id, []).append(request_id)
+
+            try:
+                # Send conversion request
+                logger.info(f"📤 Sending conversion request to {agent_id}")
+                await self.messaging_adapter.send_direct_message(agent_id, request_content)
+
+                # Wait for the response future with timeout
+                try:
+                    response = await asyncio.wait_for(future, timeout=timeout)
+                except asyncio.TimeoutError:
+                    logger.error(f"❌ Conversion timeout after {timeout} seconds")
+                    return False
+            finally:
+                self._pending.pop(request_id, None)
+                pending_ids = self._agent_pending.get(agent_id)
+                if pending_ids and request_id in pending_ids:
+                    pending_ids.remove(request_id)
+                    if not pending_ids:
+                        del self._agent_pending[agent_id]
+
+            # Check if conversion was successful
+            if response.get("conversion_status") == "success" or response.get("success") == True:
+                # Extract converted file data
+                converted_data = response.get("file_data") or response.get("output_data")
+
+                if not converted_data:
+                    logger.error("❌ No converted data in response")
+                    return False
+
+                # Decode and save converted file. Raw bytes (from agents on
+                # binary-capable transports) skip the base64 decode pass.
+                try:
+                    if isinstance(converted_data, (bytes, bytearray, memoryview)):
+                        converted_bytes = bytes(converted_data)
+                    else:
+                        converted_bytes = base64.b64decode(converted_data)
+
+                    # Transparently decompress zstd-encoded responses
+                    if response.get("encoding") in ("zstd", "zstd+b64"):
+                        if _ZSTD_DCTX is None:
+                            logger.error("❌ Response is zstd-compressed but zstandard is not installed")
                             return False
-                    
-                    elif response.get("conversion_status") == "error" or response.get("success") == False:
-                        error_msg = response.get("error", "Unknown error")
-                        logger.error(f"❌ Conversion failed: {error_msg}")
-                        return False
-            
-            # Timeout reached
-            logger.error(f"❌ Conversion timeout after {timeout} seconds")
-            return False
-            
+                        converted_bytes = _ZSTD_DCTX.decompress(converted_bytes)
+
+                    # Ensure output directory exists (skip the syscalls for
+                    # directories this client already created)
+                    output_dir = output_file.parent
+                    if output_dir not in self._ensured_dirs:
+                        output_dir.mkdir(parents=True, exist_ok=True)
+                        self._ensured_dirs.add(output_dir)
+
+                    # Write converted file without blocking the event loop
+                    await loop.run_in_executor(None, output_file.write_bytes, converted_bytes)
+
+                    logger.info(f"✅ Conversion successful: {output_file}")
+                    return True
+
+                except Exception as e:
+                    logger.error(f"❌ Error saving converted file: {e}")
+                    return False
+
+            else:
+                error_msg = response.get("error", "Unknown error")
+                logger.error(f"❌ Conversion failed: {error_msg}")
+                return False
+
         except Exception as e:
             logger.error(f"❌ Error during file conversion: {e}")
             return False
@@ -257,42 +447,75 @@ class OpenConvertClient:
     async def convert_files_batch(
         self,
         files: List[Dict[str, Any]],
-        timeout: int = 60
+        timeout: int = 60,
+        max_concurrency: int = 8
     ) -> List[bool]:
         """Convert multiple files in batch.
-        
+
+        Conversions are dispatched concurrently (bounded by max_concurrency)
+        so network round trips overlap instead of accumulating one per file.
+
         Args:
             files: List of file conversion specifications, each containing:
                    - input_file: Path to input file
-                   - output_file: Path to output file  
+                   - output_file: Path to output file
                    - source_format: Source MIME type
                    - target_format: Target MIME type
                    - prompt: Optional conversion prompt
             timeout: Timeout per file in seconds
-            
+            max_concurrency: Maximum number of conversions in flight at once
+
         Returns:
             List of success flags for each conversion
         """
-        results = []
-        
-        for i, file_spec in enumerate(files, 1):
-            logger.info(f"Processing file {i}/{len(files)}")
-            
-            try:
-                success = await self.convert_file(
+        # Discover once per unique format pair up front and hand the chosen
+        # agent to every file in that group, so the per-file conversions
+        # below skip discovery entirely
+        unique_pairs = list({
+            (spec['source_format'], spec['target_format']) for spec in files
+        })
+        pair_agents: Dict[Tuple[str, str], str] = {}
+        if unique_pairs:
+            discoveries = await asyncio.gather(
+                *(self.discover_agents(source_format, target_format)
+                  for source_format, target_format in unique_pairs),
+                return_exceptions=True
+            )
+            for pair, agents in zip(unique_pairs, discoveries):
+                if not isinstance(agents, BaseException) and agents:
+                    pair_agents[pair] = agents[0]['agent_id']
+
+        # A non-positive bound would create Semaphore(0) and hang the
+        # gather forever; clamp to serial instead
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _convert_one(index: int, file_spec: Dict[str, Any]) -> bool:
+            async with semaphore:
+                logger.info(f"Processing file {index}/{len(files)}")
+                pair = (file_spec['source_format'], file_spec['target_format'])
+                return await self.convert_file(
                     input_file=file_spec['input_file'],
                     output_file=file_spec['output_file'],
                     source_format=file_spec['source_format'],
                     target_format=file_spec['target_format'],
                     prompt=file_spec.get('prompt'),
-                    timeout=timeout
+                    timeout=timeout,
+                    agent_id=file_spec.get('agent_id') or pair_agents.get(pair)
                 )
-                results.append(success)
-                
-            except Exception as e:
-                logger.error(f"❌ Error processing file {i}: {e}")
+
+        outcomes = await asyncio.gather(
+            *(_convert_one(i, spec) for i, spec in enumerate(files, 1)),
+            return_exceptions=True
+        )
+
+        results = []
+        for i, outcome in enumerate(outcomes, 1):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ Error processing file {i}: {outcome}")
                 results.append(False)
-        
+            else:
+                results.append(outcome)
+
         return results
     
     async def list_available_conversions(self) -> Dict[str, List[str]]:
@@ -307,24 +530,36 @@ class OpenConvertClient:
         logger.info("📋 Querying available conversions...")
         
         # This would require a more sophisticated discovery mechanism
-        # For now, return a basic set based on known conversion categories
-        conversions = {}
-        
+        # For now, probe a basic set based on known conversion categories
+
         # Common conversions to check for
         common_formats = [
             'text/plain', 'text/markdown', 'text/html', 'application/pdf',
             'image/png', 'image/jpeg', 'image/gif', 'image/bmp',
             'audio/mp3', 'audio/wav', 'video/mp4', 'application/zip'
         ]
-        
-        for source_format in common_formats:
-            conversions[source_format] = []
-            for target_format in common_formats:
-                if source_format != target_format:
-                    agents = await self.discover_agents(source_format, target_format)
-                    if agents:
-                        conversions[source_format].append(target_format)
-        
+
+        # Fan out all discovery probes concurrently instead of paying one
+        # round trip per (source, target) pair sequentially
+        pairs = [
+            (source_format, target_format)
+            for source_format in common_formats
+            for target_format in common_formats
+            if source_format != target_format
+        ]
+        results = await asyncio.gather(
+            *(self.discover_agents(source_format, target_format)
+              for source_format, target_format in pairs),
+            return_exceptions=True
+        )
+
+        conversions: Dict[str, List[str]] = {fmt: [] for fmt in common_formats}
+        for (source_format, target_format), agents in zip(pairs, results):
+            if isinstance(agents, BaseException):
+                logger.debug(f"Discovery failed for {source_format} -> {target_format}: {agents}")
+            elif agents:
+                conversions[source_format].append(target_format)
+
         return conversions
     
     async def disconnect(self) -> None:
@@ -333,8 +568,46 @@ class OpenConvertClient:
             logger.info("🔌 Disconnecting from OpenConvert network")
             await self.client.disconnect()
             self.connected = False
+            self._discover_cache.clear()
             logger.info("✅ Disconnected successfully")
 
+    async def __aenter__(self) -> "OpenConvertClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        await self.disconnect()
+
+
+# Connected clients cached per (host, port) so repeated convenience calls
+# reuse the handshake instead of reconnecting every time
+_default_clients: Dict[Tuple[str, int], OpenConvertClient] = {}
+
+
+async def get_client(host: str = "network.openconvert.ai", port: int = 8765) -> OpenConvertClient:
+    """Get a connected client for the given network, reusing cached ones.
+
+    Args:
+        host: Network host
+        port: Network port
+
+    Returns:
+        OpenConvertClient: A connected client
+
+    Raises:
+        ConnectionError: If connecting to the network fails
+    """
+    # A cached client is only valid on the loop that created it: its
+    # transport and futures are bound to that loop, and asyncio.run-style
+    # callers close their loop on return, leaving connected=True behind.
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get((host, port))
+    if client is None or not client.connected or client._loop is not loop:
+        client = OpenConvertClient()
+        if not await client.connect(host=host, port=port):
+            raise ConnectionError(f"Failed to connect to OpenConvert network at {host}:{port}")
+        _default_clients[(host, port)] = client
+    return client
+
 
 # Convenience functions for direct usage
 async def convert_file(
@@ -360,33 +633,22 @@ async def convert_file(
     Returns:
         bool: True if conversion successful
     """
-    client = OpenConvertClient()
-    
-    try:
-        # Auto-detect formats if not provided
-        if source_format is None:
-            import mimetypes
-            source_format, _ = mimetypes.guess_type(str(input_file))
-            if source_format is None:
-                source_format = 'application/octet-stream'
-        
-        if target_format is None:
-            import mimetypes
-            target_format, _ = mimetypes.guess_type(str(output_file))
-            if target_format is None:
-                target_format = 'application/octet-stream'
-        
-        # Connect and convert
-        await client.connect(host=host, port=port)
-        success = await client.convert_file(
-            input_file=input_file,
-            output_file=output_file,
-            source_format=source_format,
-            target_format=target_format,
-            prompt=prompt
-        )
-        
-        return success
-        
-    finally:
-        await client.disconnect() 
\ No newline at end of file
+    # Auto-detect formats if not provided. The input exists on disk, so
+    # content sniffing can rescue a missing/misleading extension; the
+    # output does not exist yet, so only its extension can be consulted.
+    if source_format is None:
+        source_format = _detect_mime(input_file)
+
+    if target_format is None:
+        target_format = _EXT2MIME.get(output_file.suffix.lower(), 'application/octet-stream')
+
+    # Reuse a cached connection for this network instead of paying the
+    # handshake and registration grace on every call
+    client = await get_client(host=host, port=port)
+    return await client.convert_file(
+        input_file=input_file,
+        output_file=output_file,
+        source_format=source_format,
+        target_format=target_format,
+        prompt=prompt
+    ) 
\ No newline at end of file
@@ -12,67 +12,143 @@ Usage:
 """
 
 import argparse
-import asyncio
+import functools
 import logging
 import sys
 import os
+import stat as stat_module
 import mimetypes
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import (
+    TYPE_CHECKING, Optional, List, Dict, Any, Tuple, Iterable, Iterator
+)
 
-# Add the openagents src to Python path
-current_dir = Path(__file__).resolve().parent
-openagents_root = current_dir.parent.parent
-sys.path.insert(0, str(openagents_root / "src"))
+if TYPE_CHECKING:
+    from openconvert.client import OpenConvertClient
 
-from openconvert.client import OpenConvertClient
+# asyncio and the client (which drags in the openagents stack) are
+# imported lazily by the functions that need them, so --help and
+# argument-error exits never pay for the heavy import graph
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+def _ensure_openagents_path() -> None:
+    """Make a sibling openagents checkout importable (dev layouts only).
+
+    Skipped entirely for installed packages: the resolve() walk and
+    sys.path mutation only help when running from a source tree next to
+    an openagents checkout (opt in with OPENCONVERT_DEV=1).
+    """
+    if __package__ and not os.environ.get("OPENCONVERT_DEV"):
+        return
+    current_dir = Path(__file__).resolve().parent
+    openagents_src = str(current_dir.parent.parent / "src")
+    if openagents_src not in sys.path:
+        sys.path.insert(0, openagents_src)
+
+# Handler/formatter setup happens in main() once the final level is
+# known from the parsed flags; --help exits never touch logging at all
 logger = logging.getLogger(__name__)
 
+# Fallback extension -> MIME map for types the system database may miss
+_FALLBACK_MIME = {
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    '.html': 'text/html',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.svg': 'image/svg+xml',
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.mp4': 'video/mp4',
+    '.avi': 'video/x-msvideo',
+    '.zip': 'application/zip',
+    '.rar': 'application/x-rar-compressed',
+}
+
+# Reverse MIME -> extension map, built once at import. The curated
+# fallback entries are inserted first so e.g. image/jpeg resolves to
+# '.jpg' deterministically rather than whatever types_map yields first.
+_MIME_TO_EXT: Dict[str, str] = {}
+for _ext, _mime in _FALLBACK_MIME.items():
+    _MIME_TO_EXT.setdefault(_mime, _ext)
+for _ext, _mime in mimetypes.types_map.items():
+    _MIME_TO_EXT.setdefault(_mime, _ext)
+del _ext, _mime
+
+
+@functools.lru_cache(maxsize=4096)
+def _mime_for_suffix(suffix: str) -> str:
+    """Resolve a lowercased file suffix to a MIME type (cached).
+
+    The MIME type only depends on the extension, so caching by suffix
+    makes repeat detections across a directory tree a single dict hit.
+
+    Args:
+        suffix: Lowercased file suffix including the dot (may be empty)
+
+    Returns:
+        str: MIME type string
+    """
+    # The curated table first: for the extensions this CLI advertises it
+    # answers without touching mimetypes.guess_type, whose first call
+    # parses the OS mime database (/etc/mime.types, registry, ...)
+    mime_type = _FALLBACK_MIME.get(suffix)
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return mime_type or 'application/octet-stream'
+
+
+@functools.lru_cache(maxsize=64)
+def _suffixes_for_mime(mime: str) -> frozenset:
+    """Set of lowercased suffixes that detect as the given MIME type.
+
+    Checked against _mime_for_suffix so membership agrees exactly with
+    what detection would return for each suffix.
+
+    Args:
+        mime: MIME type to invert
+
+    Returns:
+        frozenset: Matching suffixes including the dot
+    """
+    candidates = {s.lower() for s in _FALLBACK_MIME}
+    candidates.update(s.lower() for s in mimetypes.types_map)
+    return frozenset(s for s in candidates if _mime_for_suffix(s) == mime)
+
+
+def _suffix_of(name: str) -> str:
+    """Lowercased suffix of a bare file name, matching PurePath.suffix.
+
+    Args:
+        name: File name without directory components
+
+    Returns:
+        str: Suffix including the dot, or '' if there is none
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ''
+
 
 def detect_mime_type(file_path: Path) -> str:
     """Detect MIME type of a file.
-    
+
     Args:
         file_path: Path to the file
-        
+
     Returns:
         str: MIME type string
     """
-    mime_type, _ = mimetypes.guess_type(str(file_path))
-    if mime_type is None:
-        # Fall back to common extensions
-        ext = file_path.suffix.lower()
-        common_types = {
-            '.txt': 'text/plain',
-            '.md': 'text/markdown', 
-            '.html': 'text/html',
-            '.json': 'application/json',
-            '.xml': 'application/xml',
-            '.pdf': 'application/pdf',
-            '.doc': 'application/msword',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.bmp': 'image/bmp',
-            '.svg': 'image/svg+xml',
-            '.mp3': 'audio/mpeg',
-            '.wav': 'audio/wav',
-            '.mp4': 'video/mp4',
-            '.avi': 'video/x-msvideo',
-            '.zip': 'application/zip',
-            '.rar': 'application/x-rar-compressed',
-        }
-        mime_type = common_types.get(ext, 'application/octet-stream')
-    
-    return mime_type
+    return _mime_for_suffix(file_path.suffix.lower())
 
 
 def validate_args(args: argparse.Namespace) -> bool:
@@ -91,21 +167,23 @@ def validate_args(args: argparse.Namespace) -> bool:
         logger.error("   or: openconvert -i <input> -o <output>")
         return False
     
-    # Check input exists
+    # Check input exists (one stat call covers both existence and type)
     input_path = Path(args.input)
-    if not input_path.exists():
+    try:
+        input_is_dir = stat_module.S_ISDIR(os.stat(input_path).st_mode)
+    except OSError:
         logger.error(f"Input path does not exist: {input_path}")
         return False
-    
+
     # Validate output path
     output_path = Path(args.output)
     output_dir = output_path.parent
     if not output_dir.exists():
         logger.error(f"Output directory does not exist: {output_dir}")
         return False
-    
+
     # If input is a directory, require --from and --to (positional args don't support directory conversion)
-    if input_path.is_dir():
+    if input_is_dir:
         if not args.from_format or not args.to_format:
             logger.error("When input is a directory, --from and --to formats must be specified")
             logger.error("Example: openconvert -i docs/ -o converted/ --from text/plain --to application/pdf")
@@ -120,139 +198,263 @@ def validate_args(args: argparse.Namespace) -> bool:
     return True
 
 
-def get_input_files(input_path: Path, from_format: Optional[str] = None) -> List[Path]:
-    """Get list of input files to process.
-    
+def _walk_files(path: str):
+    """Recursively yield os.DirEntry objects for regular files under path.
+
+    os.scandir serves is_file()/is_dir() from the directory entry itself,
+    so the walk does not re-stat every path the way rglob('*') does.
+
+    Args:
+        path: Directory to walk
+
+    Yields:
+        os.DirEntry objects for regular files
+    """
+    # An unreadable or concurrently-deleted subdirectory is skipped, not
+    # fatal — the rest of the tree still converts
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry
+
+
+def get_input_files(
+    input_path: Path,
+    from_format: Optional[str] = None
+) -> Iterator[Tuple[Path, str]]:
+    """Stream the input files to process with their detected MIME types.
+
+    A generator so that directory trees are walked lazily: conversion of
+    the first files can start while the walk is still in progress, and the
+    full file list is never materialized in memory. The MIME type detected
+    while walking rides along with each path, so the conversion step does
+    not have to detect it a second time.
+
     Args:
         input_path: Input file or directory path
         from_format: Optional MIME type filter for directory scanning
-        
+
+    Yields:
+        (file path, detected MIME type) pairs
+    """
+    # One stat answers both "is it a file" and "is it a directory"
+    try:
+        mode = os.stat(input_path).st_mode
+    except OSError:
+        return
+
+    if stat_module.S_ISREG(mode):
+        yield input_path, detect_mime_type(input_path)
+
+    elif stat_module.S_ISDIR(mode):
+        # With a fixed from_format the filter is one precomputed suffix-set
+        # membership test per file for suffixes the tables know about. A
+        # miss still consults (cached) detection, so suffixes outside the
+        # tables — which detect as application/octet-stream — keep matching
+        # exactly as per-file detection would.
+        allowed = _suffixes_for_mime(from_format) if from_format else None
+        for entry in _walk_files(str(input_path)):
+            # Filtering only needs the entry name, so full Path objects are
+            # built just for the files that survive the filter
+            suffix = _suffix_of(entry.name)
+            if allowed is not None:
+                if suffix in allowed or _mime_for_suffix(suffix) == from_format:
+                    yield Path(entry.path), from_format
+            else:
+                yield Path(entry.path), _mime_for_suffix(suffix)
+
+
+def _resolve_output_dir(output_path: Path) -> Path:
+    """Resolve the directory multi-file conversions write into.
+
+    Args:
+        output_path: Output path from the command line
+
     Returns:
-        List of file paths to process
+        Path: Directory to place converted files in
     """
-    if input_path.is_file():
-        return [input_path]
-    
-    elif input_path.is_dir():
-        files = []
-        for file_path in input_path.rglob('*'):
-            if file_path.is_file():
-                # If from_format is specified, filter by MIME type
-                if from_format:
-                    file_mime = detect_mime_type(file_path)
-                    if file_mime == from_format:
-                        files.append(file_path)
-                else:
-                    files.append(file_path)
-        return files
-    
-    return []
+    if output_path.suffix:
+        # Output path has extension, treat as directory name
+        return output_path.parent / output_path.stem
+    # Output path is a directory
+    return output_path
+
+
+def _plan_conversion(
+    input_file: Path,
+    output_path: Path,
+    from_format: Optional[str],
+    to_format: Optional[str],
+    output_dir: Optional[Path]
+) -> Tuple[Path, Path, str, str]:
+    """Resolve formats and the output file path for one conversion.
+
+    Args:
+        input_file: Input file path
+        output_path: Output file or directory path
+        from_format: Source MIME type (optional, will be detected)
+        to_format: Target MIME type (optional, detected from output_path)
+        output_dir: Pre-created output directory for multi-file runs, or
+                    None for a single-file conversion straight to output_path
+
+    Returns:
+        Tuple of (input_file, output_file, source_format, target_format)
+    """
+    # Detect source format if not specified
+    source_format = from_format or detect_mime_type(input_file)
+
+    # Detect target format if not specified
+    target_format = to_format or detect_mime_type(output_path)
+
+    if output_dir is None:
+        # Single file conversion
+        output_file = output_path
+    else:
+        # Generate output filename with target extension
+        target_ext = _MIME_TO_EXT.get(target_format, '.out')
+        output_file = output_dir / f"{input_file.stem}{target_ext}"
+
+    return input_file, output_file, source_format, target_format
 
 
 async def convert(
-    input_files: List[Path],
+    input_files: Iterable[Path],
     output_path: Path,
     from_format: Optional[str] = None,
     to_format: Optional[str] = None,
     prompt: Optional[str] = None,
     host: str = "network.openconvert.ai",
-    port: int = 8765
+    port: int = 8765,
+    concurrency: int = 8,
+    client: Optional["OpenConvertClient"] = None
 ) -> bool:
     """Convert files using the OpenConvert network.
-    
+
     Args:
-        input_files: List of input file paths
+        input_files: Iterable of input file paths (may be a lazy generator)
         output_path: Output file or directory path
         from_format: Source MIME type (optional, will be detected)
         to_format: Target MIME type (optional, will be detected from output extension)
         prompt: Optional conversion prompt
         host: Network host to connect to
         port: Network port to connect to
-        
+        concurrency: Maximum number of conversions in flight at once
+        client: Optional pre-connected client to use. When None, a shared
+                client for (host, port) is fetched from the connection
+                cache, so repeated in-process calls reuse one connection.
+
     Returns:
         bool: True if conversion succeeded
     """
-    client = OpenConvertClient()
-    
+    import asyncio
+
+    _ensure_openagents_path()
+    from openconvert.client import get_client
+
+    # Zero workers would mean zero sentinels and a drained-but-unconsumed
+    # queue reporting success over nothing; clamp API callers to serial
+    concurrency = max(1, concurrency)
+
     try:
-        # Connect to the network
-        logger.info(f"Connecting to OpenConvert network at {host}:{port}")
-        await client.connect(host=host, port=port)
-        
-        # Process each input file
-        success_count = 0
-        total_files = len(input_files)
-        
-        for i, input_file in enumerate(input_files, 1):
-            logger.info(f"Processing file {i}/{total_files}: {input_file.name}")
-            
-            # Detect source format if not specified
-            source_format = from_format or detect_mime_type(input_file)
-            
-            # Detect target format if not specified
-            if to_format:
-                target_format = to_format
-            else:
-                target_format = detect_mime_type(output_path)
-            
-            logger.info(f"Converting {source_format} -> {target_format}")
-            
-            # Determine output file path
-            if len(input_files) == 1:
-                # Single file conversion
-                output_file = output_path
-            else:
-                # Multiple files - create output directory if needed
-                if output_path.suffix:
-                    # Output path has extension, treat as directory name
-                    output_dir = output_path.parent / output_path.stem
+        if client is None:
+            # Reuse the cached connection for this network; all per-file
+            # requests below multiplex over it via per-request futures
+            logger.info(f"Connecting to OpenConvert network at {host}:{port}")
+            client = await get_client(host=host, port=port)
+
+        loop = asyncio.get_running_loop()
+        file_iter = iter(input_files)
+
+        # Peek ahead one file so single-file runs still write directly to
+        # output_path rather than treating it as a directory. Pulling from
+        # the iterator happens in the executor because the directory walk
+        # behind it does blocking disk I/O.
+        first = await loop.run_in_executor(None, next, file_iter, None)
+        if first is None:
+            logger.error("No input files found to process")
+            return False
+        second = await loop.run_in_executor(None, next, file_iter, None)
+
+        # For multi-file runs, resolve and create the output directory once
+        # instead of a stat+mkdir pair per file
+        output_dir = None
+        if second is not None:
+            output_dir = _resolve_output_dir(output_path)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        # The target format depends only on --to and output_path, neither of
+        # which changes between files; resolve it once for the whole run
+        resolved_to = to_format or detect_mime_type(output_path)
+
+        # Stream files through a bounded queue into worker tasks, so the
+        # first conversions are in flight while the walk is still running
+        queue: "asyncio.Queue" = asyncio.Queue(maxsize=concurrency * 2)
+        progress = {'total': 0, 'succeeded': 0}
+
+        async def _produce() -> None:
+            for input_file in (first, second):
+                if input_file is not None:
+                    await queue.put(input_file)
+            while True:
+                input_file = await loop.run_in_executor(None, next, file_iter, None)
+                if input_file is None:
+                    break
+                await queue.put(input_file)
+            # One sentinel per worker
+            for _ in range(concurrency):
+                await queue.put(None)
+
+        async def _worker() -> None:
+            while True:
+                queued = await queue.get()
+                if queued is None:
+                    break
+
+                progress['total'] += 1
+                index = progress['total']
+
+                # get_input_files yields (path, mime) pairs; plain paths
+                # from API callers are detected here instead
+                if isinstance(queued, tuple):
+                    queued_file, detected_mime = queued
                 else:
-                    # Output path is a directory
-                    output_dir = output_path
-                
-                output_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Generate output filename with target extension
-                target_ext = None
-                for ext, mime in mimetypes.types_map.items():
-                    if mime == target_format:
-                        target_ext = ext
-                        break
-                
-                if not target_ext:
-                    # Fall back to common extensions
-                    ext_map = {
-                        'text/plain': '.txt',
-                        'text/markdown': '.md',
-                        'text/html': '.html',
-                        'application/pdf': '.pdf',
-                        'image/png': '.png',
-                        'image/jpeg': '.jpg',
-                        'application/json': '.json',
-                    }
-                    target_ext = ext_map.get(target_format, '.out')
-                
-                output_file = output_dir / f"{input_file.stem}{target_ext}"
-            
-            # Perform conversion
-            try:
-                success = await client.convert_file(
-                    input_file=input_file,
-                    output_file=output_file,
-                    source_format=source_format,
-                    target_format=target_format,
-                    prompt=prompt
+                    queued_file, detected_mime = queued, None
+
+                input_file, output_file, source_format, target_format = _plan_conversion(
+                    queued_file, output_path, from_format or detected_mime, resolved_to, output_dir
                 )
-                
+
+                logger.info(f"Processing file {index}: {input_file.name}")
+                logger.info(f"Converting {source_format} -> {target_format}")
+
+                try:
+                    success = await client.convert_file(
+                        input_file=input_file,
+                        output_file=output_file,
+                        source_format=source_format,
+                        target_format=target_format,
+                        prompt=prompt
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Error converting {input_file.name}: {e}")
+                    continue
+
                 if success:
                     logger.info(f"✅ Successfully converted to {output_file}")
-                    success_count += 1
+                    progress['succeeded'] += 1
                 else:
                     logger.error(f"❌ Failed to convert {input_file.name}")
-                    
-            except Exception as e:
-                logger.error(f"❌ Error converting {input_file.name}: {e}")
-        
+
+        await asyncio.gather(_produce(), *(_worker() for _ in range(concurrency)))
+
+        total_files = progress['total']
+        success_count = progress['succeeded']
+
         # Report results
         if success_count == total_files:
             logger.info(f"🎉 All {total_files} files converted successfully!")
@@ -267,9 +469,6 @@ async def convert(
     except Exception as e:
         logger.error(f"Error during conversion: {e}")
         return False
-        
-    finally:
-        await client.disconnect()
 
 
 async def list_available_formats(host: str = "network.openconvert.ai", port: int = 8765) -> bool:
@@ -282,6 +481,11 @@ async def list_available_formats(host: str = "network.openconvert.ai", port: int
     Returns:
         bool: True if discovery succeeded
     """
+    import asyncio
+
+    _ensure_openagents_path()
+    from openconvert.client import OpenConvertClient
+
     client = OpenConvertClient()
     
     try:
@@ -300,56 +504,76 @@ async def list_available_formats(host: str = "network.openconvert.ai", port: int
             'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         ]
         
+        print("📡 Querying agents for conversion capabilities...")
+
+        # Probe all format pairs concurrently (bounded) instead of 200+
+        # sequential round trips, and keep the agent lists so the display
+        # below never has to re-discover a pair
+        pairs = [
+            (source, target)
+            for source in test_formats
+            for target in test_formats
+            if source != target
+        ]
+        semaphore = asyncio.Semaphore(16)
+
+        async def _probe(source_format: str, target_format: str):
+            async with semaphore:
+                agents = await client.discover_agents(source_format, target_format)
+            return (source_format, target_format), agents
+
+        discovered = dict(await asyncio.gather(
+            *(_probe(source, target) for source, target in pairs)
+        ))
+
         # Dictionary to store discovered conversions
         available_conversions = {}
-        
-        print("📡 Querying agents for conversion capabilities...")
-        
-        # Test various format combinations
         for source_format in test_formats:
-            available_conversions[source_format] = []
-            for target_format in test_formats:
-                if source_format != target_format:
-                    agents = await client.discover_agents(source_format, target_format)
-                    if agents:
-                        available_conversions[source_format].append(target_format)
-        
-        # Display results
-        print("\n🎯 Available Conversions:")
-        print("=" * 60)
+            available_conversions[source_format] = [
+                target_format for target_format in test_formats
+                if source_format != target_format
+                and discovered[(source_format, target_format)]
+            ]
         
+        # Build the report in memory and emit it with one write; dozens
+        # of small print calls each take a stdout write + flush
+        out: List[str] = []
+        out.append("\n🎯 Available Conversions:")
+        out.append("=" * 60)
+
         total_conversions = 0
         total_agents = set()
-        
+
         for source_format, target_formats in available_conversions.items():
             if target_formats:
                 # Get a friendly name for the format
                 source_name = get_format_name(source_format)
-                print(f"\n📄 {source_name} ({source_format}):")
-                
+                out.append(f"\n📄 {source_name} ({source_format}):")
+
                 for target_format in target_formats:
                     target_name = get_format_name(target_format)
-                    # Get agents for this conversion
-                    agents = await client.discover_agents(source_format, target_format)
+                    # Agents were captured during the probe sweep above
+                    agents = discovered[(source_format, target_format)]
                     agent_names = [agent.get('agent_id', 'Unknown') for agent in agents]
                     total_agents.update(agent_names)
-                    
-                    print(f"  ➜ {target_name} ({target_format})")
-                    print(f"    Agents: {', '.join(agent_names)}")
+
+                    out.append(f"  ➜ {target_name} ({target_format})")
+                    out.append(f"    Agents: {', '.join(agent_names)}")
                     total_conversions += 1
-        
+
         # Summary
-        print(f"\n📊 Summary:")
-        print(f"   🔄 Total conversions available: {total_conversions}")
-        print(f"   🤖 Active agents: {len(total_agents)}")
-        
+        out.append(f"\n📊 Summary:")
+        out.append(f"   🔄 Total conversions available: {total_conversions}")
+        out.append(f"   🤖 Active agents: {len(total_agents)}")
+
         if total_conversions == 0:
-            print("\n⚠️  No conversion agents found!")
-            print("   Make sure conversion agents are running:")
-            print("   • python demos/openconvert/run_agent.py doc")
-            print("   • python demos/openconvert/run_agent.py image")
-            print("   • python demos/openconvert/run_agent.py audio")
-            
+            out.append("\n⚠️  No conversion agents found!")
+            out.append("   Make sure conversion agents are running:")
+            out.append("   • python demos/openconvert/run_agent.py doc")
+            out.append("   • python demos/openconvert/run_agent.py image")
+            out.append("   • python demos/openconvert/run_agent.py audio")
+
+        sys.stdout.write("\n".join(out) + "\n")
         return True
         
     except Exception as e:
@@ -363,82 +587,171 @@ async def list_available_formats(host: str = "network.openconvert.ai", port: int
         await client.disconnect()
 
 
+# Friendly display names for MIME types, built once at import
+_FORMAT_NAMES: Dict[str, str] = {
+    'text/plain': 'Plain Text',
+    'text/markdown': 'Markdown',
+    'text/html': 'HTML',
+    'text/csv': 'CSV',
+    'application/pdf': 'PDF',
+    'application/json': 'JSON',
+    'application/xml': 'XML',
+    'application/zip': 'ZIP Archive',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'Word Document',
+    'image/png': 'PNG Image',
+    'image/jpeg': 'JPEG Image',
+    'image/gif': 'GIF Image',
+    'image/bmp': 'BMP Image',
+    'audio/mp3': 'MP3 Audio',
+    'audio/wav': 'WAV Audio',
+    'video/mp4': 'MP4 Video'
+}
+
+
 def get_format_name(mime_type: str) -> str:
     """Get a friendly name for a MIME type.
-    
+
     Args:
         mime_type: MIME type string
-        
+
     Returns:
         str: Friendly format name
     """
-    format_names = {
-        'text/plain': 'Plain Text',
-        'text/markdown': 'Markdown',
-        'text/html': 'HTML',
-        'text/csv': 'CSV',
-        'application/pdf': 'PDF',
-        'application/json': 'JSON',
-        'application/xml': 'XML',
-        'application/zip': 'ZIP Archive',
-        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'Word Document',
-        'image/png': 'PNG Image',
-        'image/jpeg': 'JPEG Image', 
-        'image/gif': 'GIF Image',
-        'image/bmp': 'BMP Image',
-        'audio/mp3': 'MP3 Audio',
-        'audio/wav': 'WAV Audio',
-        'video/mp4': 'MP4 Video'
-    }
-    return format_names.get(mime_type, mime_type)
+    return _FORMAT_NAMES.get(mime_type, mime_type)
 
 
-def main() -> int:
-    """Main CLI entry point.
-    
-    Returns:
-        int: Exit code (0 for success, 1 for error)
-    """
-    parser = argparse.ArgumentParser(
-        prog="openconvert",
-        description="Connect to OpenConvert OpenAgents network for file conversions",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+# Help epilog: a plain module-level string (no interpolation), attached
+# to the parser only when help is actually requested so ordinary runs
+# skip the formatter's epilog processing
+_EPILOG = """
 Examples:
   # Simple file conversion (positional arguments)
   openconvert input.txt output.pdf
   openconvert image.png image.jpg
-  
-  # Using flags (traditional way)  
+
+  # Using flags (traditional way)
   openconvert -i input.txt -o output.pdf
   openconvert -i image.png -o image.jpg
-  
+
   # Directory conversion (requires format specification)
   openconvert -i docs/ -o converted/ --from text/plain --to application/pdf
-  
+
   # Convert with format specification
   openconvert input.data output.pdf --from text/csv --to application/pdf
-  
+
   # Convert with custom prompt
   openconvert data.csv report.pdf --prompt "Create a formatted report with charts"
-  
+
   # Specify network connection
   openconvert file.doc file.md --host remote.server.com --port 8765
-  
+
   # List available formats
   openconvert --list-formats
 
 Supported formats include:
   Documents: txt, pdf, docx, html, md, rtf, csv, xlsx
-  Images: png, jpg, jpeg, bmp, gif, tiff, svg, webp  
+  Images: png, jpg, jpeg, bmp, gif, tiff, svg, webp
   Audio: mp3, wav, ogg, flac, aac
   Video: mp4, avi, mkv, mov, webm
   Archives: zip, rar, 7z, tar, gz
   Code: json, xml, yaml, html, latex
   Models: stl, obj, fbx, ply
-        """
+"""
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for integer flags that must be at least 1.
+
+    Args:
+        value: Raw command-line token
+
+    Returns:
+        int: The parsed value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is below 1
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _sniff_mode(argv: List[str]) -> str:
+    """Classify an invocation from raw argv before building a parser.
+
+    A plain scan is far cheaper than constructing the full parser, so
+    modes that only need a handful of flags can get a minimal one.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        str: 'list-formats' or 'convert'
+    """
+    for arg in argv:
+        if arg == '--':
+            break
+        if arg == '--list-formats':
+            return 'list-formats'
+    return 'convert'
+
+
+@functools.lru_cache(maxsize=1)
+def _build_list_formats_parser() -> argparse.ArgumentParser:
+    """Build the minimal parser for --list-formats invocations (cached).
+
+    Returns:
+        argparse.ArgumentParser: Parser with only the flags that path uses
+    """
+    parser = argparse.ArgumentParser(
+        prog="openconvert",
+        description="Connect to OpenConvert OpenAgents network for file conversions",
     )
-    
+    parser.add_argument(
+        "--list-formats",
+        action="store_true",
+        help="List all available conversion formats from connected agents"
+    )
+    parser.add_argument(
+        "--host",
+        default="network.openconvert.ai",
+        help="OpenConvert network host (default: network.openconvert.ai)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="OpenConvert network port (default: 8765)"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable verbose logging"
+    )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Suppress all output except errors"
+    )
+    # Attributes main() touches before dispatching to the list path
+    parser.set_defaults(input_file=None, output_file=None, input=None, output=None)
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (cached across invocations).
+
+    Returns:
+        argparse.ArgumentParser: The configured parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="openconvert",
+        description="Connect to OpenConvert OpenAgents network for file conversions",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
     # Positional arguments (optional)
     parser.add_argument(
         "input_file",
@@ -477,6 +790,14 @@ Supported formats include:
         help="Additional instructions for the conversion (e.g., 'compress by 50%%', 'add a title')"
     )
     
+    # Concurrency options
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=8,
+        help="Maximum number of conversions in flight at once (default: 8)"
+    )
+
     # Network connection options
     parser.add_argument(
         "--host",
@@ -508,72 +829,125 @@ Supported formats include:
         action="store_true",
         help="List all available conversion formats from connected agents"
     )
-    
-    # Parse arguments
-    args = parser.parse_args()
-    
-    # Merge positional and flag arguments (positional takes precedence)
-    if args.input_file:
-        args.input = args.input_file
-    if args.output_file:
-        args.output = args.output_file
-    
-    # Configure logging level
-    if args.quiet:
-        logging.getLogger().setLevel(logging.ERROR)
-    elif args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
-    
+
+    return parser
+
+
+async def run_async(args: argparse.Namespace) -> int:
+    """Execute a parsed CLI invocation on the caller's event loop.
+
+    Embedders with a running loop can await this directly, skipping the
+    per-call event loop setup and teardown of asyncio.run (and reusing
+    the cached network connection across calls).
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        int: Exit code (0 for success, 1 for error)
+    """
     # Handle list-formats option
     if args.list_formats:
         try:
-            success = asyncio.run(list_available_formats(
-                host=args.host,
-                port=args.port
-            ))
+            success = await list_available_formats(host=args.host, port=args.port)
             return 0 if success else 1
-        except KeyboardInterrupt:
-            logger.info("Discovery cancelled by user")
-            return 1
         except Exception as e:
             logger.error(f"Error discovering formats: {e}")
             return 1
-    
+
     # Validate arguments for conversion operations
     if not validate_args(args):
         return 1
-    
-    # Get input files
+
+    # Get input files as a lazy stream; convert() reports if none are found
     input_path = Path(args.input)
     input_files = get_input_files(input_path, args.from_format)
-    
-    if not input_files:
-        logger.error("No input files found to process")
-        return 1
-    
-    logger.info(f"Found {len(input_files)} files to process")
-    
+
     # Run conversion
     try:
-        success = asyncio.run(convert(
+        success = await convert(
             input_files=input_files,
             output_path=Path(args.output),
             from_format=args.from_format,
             to_format=args.to_format,
             prompt=args.prompt,
             host=args.host,
-            port=args.port
-        ))
-        
+            port=args.port,
+            concurrency=args.concurrency
+        )
         return 0 if success else 1
-        
-    except KeyboardInterrupt:
-        logger.info("Conversion cancelled by user")
-        return 1
+
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         return 1
 
 
+def run(args: argparse.Namespace) -> int:
+    """Execute a parsed CLI invocation, managing its own event loop.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        int: Exit code (0 for success, 1 for error)
+    """
+    import asyncio
+
+    # Swap in uvloop when installed (speedups extra): the selector loop
+    # it replaces is measurably slower for RPC-heavy runs like
+    # --list-formats sweeps and concurrent directory conversions
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    try:
+        return asyncio.run(run_async(args))
+    except KeyboardInterrupt:
+        logger.info("Cancelled by user")
+        return 1
+
+
+def main() -> int:
+    """Main CLI entry point.
+
+    Returns:
+        int: Exit code (0 for success, 1 for error)
+    """
+    # Sniff the mode first: the --list-formats path parses with a
+    # minimal parser instead of constructing every conversion flag.
+    # Both parsers are cached for repeat in-process use.
+    argv = sys.argv[1:]
+    if _sniff_mode(argv) == 'list-formats':
+        args = _build_list_formats_parser().parse_args(argv)
+    else:
+        parser = _build_parser()
+        # The examples epilog only matters when help will be printed
+        if '-h' in argv or '--help' in argv:
+            parser.epilog = _EPILOG
+        args = parser.parse_args(argv)
+
+    # Configure logging once, at the final level
+    if args.quiet:
+        level = logging.ERROR
+    elif args.verbose:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Merge positional and flag arguments (positional takes precedence)
+    if args.input_file:
+        args.input = args.input_file
+    if args.output_file:
+        args.output = args.output_file
+
+    return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main()) 
\ No newline at end of file